@@ -1,12 +1,75 @@
-import re
+import bisect
+import functools
 import math
-import random
+import os
+import re
 import string
-from typing import Dict, List, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+# Character pools for password generation, fixed for the process lifetime
+_LOWER = string.ascii_lowercase
+_UPPER = string.ascii_uppercase
+_DIGITS = string.digits
+_PUNCT = string.punctuation.replace(' ', '')
+_ALL_CHARS = _LOWER + _UPPER + _DIGITS + _PUNCT
+_POOL_SETS = (frozenset(_LOWER), frozenset(_UPPER), frozenset(_DIGITS), frozenset(_PUNCT))
+
+# Character-class bits used by the translate-based classifier
+_CLASS_LOWER = 1
+_CLASS_UPPER = 2
+_CLASS_DIGIT = 4
+_CLASS_SPECIAL = 8
+
+# Issue-code bits set by the scoring core; each indexes a row of
+# PasswordAnalyzer._issue_table
+_ISSUE_SPACES = 1 << 0
+_ISSUE_TOO_SHORT = 1 << 1
+_ISSUE_VARIETY = 1 << 2
+_ISSUE_COMMON = 1 << 3
+_ISSUE_DICTIONARY = 1 << 4
+_ISSUE_PERSONAL = 1 << 5
+_ISSUE_REPEAT = 1 << 6
+_ISSUE_SEQUENTIAL = 1 << 7
+
+@dataclass
+class AnalysisResult:
+    """
+    Raw analysis output with unrounded entropy values; to_dict() renders
+    the legacy dict shape used by the CLI
+    """
+    __slots__ = ('score', 'strength', 'issues', 'recommendations',
+                 'entropy', 'max_entropy', 'generated_password', 'has_spaces')
+
+    score: int
+    strength: str
+    issues: List[str]
+    recommendations: List[str]
+    entropy: float
+    max_entropy: float
+    generated_password: Optional[str]
+    has_spaces: bool
+
+    def to_dict(self) -> Dict[str, any]:
+        return {
+            "score": self.score,
+            "strength": self.strength,
+            "issues": self.issues,
+            "recommendations": self.recommendations,
+            "entropy": round(self.entropy, 2),
+            "max_entropy": round(self.max_entropy, 2),
+            "generated_password": self.generated_password,
+            "has_spaces": self.has_spaces,
+        }
+
 
 class PasswordAnalyzer:
+    SEQUENTIAL_NEEDLES = (b'123', b'abc', b'xyz')
+    SEQUENTIAL_NEEDLES_STR = ('123', 'abc', 'xyz')
+
     def __init__(self):
         self.min_length = 12
+        self.max_scan_length = 256  # pattern scans are capped at this many characters
         self.common_patterns = [
             r'password', r'admin', r'user', r'login', r'1234', r'qwerty',
             r'abc', r'letmein', r'welcome', r'monkey', r'secret', r'love',
@@ -18,164 +81,328 @@ class PasswordAnalyzer:
             'work', 'play', 'dog', 'cat', 'bird', 'fish', 'game', 'life'
         ]
         self.max_charset_size = 26 + 26 + 10 + 15  # lowercase + uppercase + digits + special chars (no spaces)
+        self._thresholds = [30, 50, 70, 90]
+        self._labels = ["Very Weak", "Weak", "Moderate", "Strong", "Excellent"]
+
+        # (issue template, recommendation template, score penalty) per issue
+        # bit; templates are formatted once at result-materialization time
+        self._issue_table = [
+            ("Password contains spaces", "Avoid using spaces in passwords", 15),
+            ("Password is too short ({length} characters)", "Use at least {min_length} characters", 0),
+            ("Limited character variety", "Include a mix of uppercase, lowercase, numbers, and special characters", 0),
+            ("Contains common pattern or word", "Avoid common words or predictable patterns", 20),
+            ("Contains dictionary word", "Avoid using common dictionary words", 15),
+            ("Contains personal information", "Avoid using personal details like name or birthdate", 20),
+            ("Contains repeated characters", "Avoid repeating the same character multiple times", 10),
+            ("Contains sequential characters", "Avoid sequential characters like '123' or 'abc'", 10),
+        ]
+
+        # One fused pattern, compiled once, covers both needle categories so
+        # a single pass over the password replaces separate common-pattern
+        # and dictionary-word scans
+        common_alt = b'|'.join(re.escape(p.encode()) for p in self.common_patterns)
+        dict_alt = b'|'.join(re.escape(w.encode()) for w in self.dictionary_words)
+        self._needle_re = re.compile(
+            b'(?P<common>' + common_alt + b')|(?P<dict>' + dict_alt + b')')
+        # str twin driving the fallback scan for non-ASCII passwords
+        self._needle_re_str = re.compile(self._needle_re.pattern.decode('ascii'))
+
+        # Word-byte table backing the manual boundary check that replaces
+        # the regex engine's \b logic around dictionary-word hits
+        word_char = bytearray(256)
+        for b in (string.ascii_lowercase + string.digits + '_').encode():
+            word_char[b] = 1
+        self._word_char = bytes(word_char)
+
+        # Lookup table mapping each byte value to its character-class bits,
+        # used by the single-pass scanner below
+        class_of = [0] * 256
+        for b in string.ascii_lowercase.encode():
+            class_of[b] = _CLASS_LOWER
+        for b in string.ascii_uppercase.encode():
+            class_of[b] = _CLASS_UPPER
+        for b in string.digits.encode():
+            class_of[b] = _CLASS_DIGIT
+        for b in b'!@#$%^&*(),.?":{}|<>':
+            class_of[b] = _CLASS_SPECIAL
+        self._class_of = class_of
 
-    def analyze_password(self, password: str, personal_info: List[str] = None) -> Dict[str, any]:
+        # Precompute log2 for every reachable charset size so no log2 (or
+        # bignum exponentiation) happens at analysis time
+        self._log2_max = math.log2(self.max_charset_size)
+        self._log2_table = {}
+        for lower in (0, 26):
+            for upper in (0, 26):
+                for digit in (0, 10):
+                    for special in (0, 15):
+                        size = lower + upper + digit + special
+                        if size:
+                            self._log2_table[size] = math.log2(size)
+
+        # Per-instance memo of the deterministic scoring core; UIs tend to
+        # re-analyze the same input on every keystroke or debounce fire
+        self._score_cached = functools.lru_cache(maxsize=1024)(self._score_core)
+
+    def analyze_password(self, password: str, personal_info: List[str] = None,
+                         suggest: bool = True, raw: bool = False) -> Dict[str, any]:
         """
         Analyzes password strength and returns detailed feedback
         Personal_info: List of strings like name, birthdate to check against
+        Suggest: set False to skip generating a replacement password
+        Raw: return the AnalysisResult itself instead of its dict form,
+        skipping rounding and dict construction for batch callers
         """
         if not password:
-            return {
-                "score": 0,
-                "strength": "Invalid",
-                "issues": ["Password cannot be empty"],
-                "recommendations": ["Enter a non-empty password"],
-                "generated_password": None,
-                "entropy": 0,
-                "max_entropy": 0
-            }
-
-        score = 0
+            result = AnalysisResult(
+                score=0,
+                strength="Invalid",
+                issues=["Password cannot be empty"],
+                recommendations=["Enter a non-empty password"],
+                entropy=0,
+                max_entropy=0,
+                generated_password=None,
+                has_spaces=False,
+            )
+            return result if raw else result.to_dict()
+
+        score, entropy, max_entropy, flags = \
+            self._score_cached(password, tuple(personal_info or ()))
+        has_spaces = bool(flags & _ISSUE_SPACES)
+
         issues = []
         recommendations = []
-        personal_info = personal_info or []
-        has_spaces = False
-
-        # Check for spaces
-        if ' ' in password:
-            has_spaces = True
-            issues.append("Password contains spaces")
-            recommendations.append("Avoid using spaces in passwords")
-            score -= 15
-
-        # Check length
-        length_score = min(len(password) * 5, 40)
-        score += length_score
-        if len(password) < self.min_length:
-            issues.append(f"Password is too short ({len(password)} characters)")
-            recommendations.append(f"Use at least {self.min_length} characters")
-
-        # Check character variety
-        has_lower = bool(re.search(r'[a-z]', password))
-        has_upper = bool(re.search(r'[A-Z]', password))
-        has_digit = bool(re.search(r'\d', password))
-        has_special = bool(re.search(r'[!@#$%^&*(),.?":{}|<>]', password))
-        
-        char_types = sum([has_lower, has_upper, has_digit, has_special])
-        char_score = char_types * 15
-        score += char_score
-        
+        for i, (issue, recommendation, _penalty) in enumerate(self._issue_table):
+            if flags & (1 << i):
+                issues.append(issue.format(length=len(password), min_length=self.min_length))
+                recommendations.append(recommendation.format(length=len(password), min_length=self.min_length))
+
+        # Determine strength
+        strength = self._labels[bisect.bisect_right(self._thresholds, score)]
+
+        # Only pay for password generation when a suggestion is wanted
+        generated_password = None
+        if suggest and strength != "Excellent":
+            generated_password = self.generate_excellent_password()
+
+        result = AnalysisResult(
+            score=score,
+            strength=strength,
+            issues=issues if issues else ["No major issues detected"],
+            recommendations=recommendations if recommendations else ["Maintain good password practices"],
+            entropy=entropy,
+            max_entropy=max_entropy,
+            generated_password=generated_password,
+            has_spaces=has_spaces,
+        )
+        return result if raw else result.to_dict()
+
+    def analyze_passwords(self, passwords: List[str], personal_info: List[str] = None,
+                          suggest: bool = False, raw: bool = False) -> List[Dict[str, any]]:
+        """
+        Analyzes many passwords in one call, for auditing workloads such as
+        scoring a breach corpus. Reuses the precompiled scanners and the
+        score cache across the whole batch; suggestions default off since
+        bulk callers rarely display them
+        """
+        personal_info = list(personal_info) if personal_info else None
+        return [self.analyze_password(password, personal_info, suggest=suggest, raw=raw)
+                for password in passwords]
+
+    def _score_core(self, password: str, personal_info: Tuple[str, ...]) -> Tuple:
+        """
+        Scans and scores a password, returning only primitive facts:
+        (score, entropy, max_entropy, issue_flags) where issue_flags is a
+        bitmask of _ISSUE_* codes. Message formatting stays out of this hot
+        path so it can be reused by batch callers without string overhead
+        """
+        pw_len = len(password)
+
+        # The single-pass scan is linear and covers the whole password, so
+        # classes, repeats, and entropy always reflect the full input; only
+        # the pattern scans are capped for pathologically long passwords
+        ascii_only = password.isascii()
+        if ascii_only:
+            # Byte-indexed class lookups and byte-level substring search
+            # skip the str Unicode machinery
+            buf = password.encode('ascii')
+            class_mask, repeat_run_max, has_space = self._scan(buf)
+            if pw_len > self.max_scan_length:
+                buf = buf[:self.max_scan_length]
+            buf_lower = buf.lower()
+            needle_re = self._needle_re
+            sequential_needles = self.SEQUENTIAL_NEEDLES
+        else:
+            # Non-ASCII passwords stay on a str scan: replacement bytes
+            # would fake character classes and repeated runs
+            class_mask, repeat_run_max, has_space = self._scan_str(password)
+            buf_lower = password[:self.max_scan_length].lower() \
+                if pw_len > self.max_scan_length else password.lower()
+            needle_re = self._needle_re_str
+            sequential_needles = self.SEQUENTIAL_NEEDLES_STR
+
+        score = min(pw_len * 5, 40)
+        flags = 0
+        if has_space:
+            flags |= _ISSUE_SPACES
+        if pw_len < self.min_length:
+            flags |= _ISSUE_TOO_SHORT
+
+        has_lower = bool(class_mask & _CLASS_LOWER)
+        has_upper = bool(class_mask & _CLASS_UPPER)
+        has_digit = bool(class_mask & _CLASS_DIGIT)
+        has_special = bool(class_mask & _CLASS_SPECIAL)
+        char_types = has_lower + has_upper + has_digit + has_special
+        score += char_types * 15
         if char_types < 3:
-            issues.append("Limited character variety")
-            recommendations.append("Include a mix of uppercase, lowercase, numbers, and special characters")
-
-        # Check for common patterns
-        for pattern in self.common_patterns:
-            if re.search(pattern, password.lower()):
-                issues.append("Contains common pattern or word")
-                recommendations.append("Avoid common words or predictable patterns")
-                score -= 20
-                break
+            flags |= _ISSUE_VARIETY
 
-        # Check for dictionary words
-        for word in self.dictionary_words:
-            if re.search(r'\b' + word + r'\b', password.lower()):
-                issues.append("Contains dictionary word")
-                recommendations.append("Avoid using common dictionary words")
-                score -= 15
+        both_needles = _ISSUE_COMMON | _ISSUE_DICTIONARY
+        pos = 0
+        while flags & both_needles != both_needles:
+            m = needle_re.search(buf_lower, pos)
+            if m is None:
                 break
+            if m.lastgroup == 'common':
+                flags |= _ISSUE_COMMON
+                pos = m.end()
+            elif self._is_word_boundary(buf_lower, m.start(), m.end()):
+                flags |= _ISSUE_DICTIONARY
+                pos = m.end()
+            else:
+                # A rejected dictionary hit must not consume its span, or it
+                # would hide an overlapping common pattern starting inside it
+                pos = m.start() + 1
 
-        # Check for personal information
-        for info in personal_info:
-            if info and info.lower() in password.lower():
-                issues.append("Contains personal information")
-                recommendations.append("Avoid using personal details like name or birthdate")
-                score -= 20
-                break
+        if personal_info:
+            if ascii_only:
+                # Non-ASCII entries cannot occur in an ASCII password
+                lowered_info = [info.lower().encode('ascii') for info in personal_info
+                                if info and info.isascii()]
+            else:
+                lowered_info = [info.lower() for info in personal_info if info]
+            if any(info in buf_lower for info in lowered_info):
+                flags |= _ISSUE_PERSONAL
 
-        # Check for repeated characters
-        if re.search(r'(.)\1{2,}', password):
-            issues.append("Contains repeated characters")
-            recommendations.append("Avoid repeating the same character multiple times")
-            score -= 10
+        if repeat_run_max >= 3:
+            flags |= _ISSUE_REPEAT
+        if any(s in buf_lower for s in sequential_needles):
+            flags |= _ISSUE_SEQUENTIAL
 
-        # Check for sequential characters
-        if re.search(r'123|abc|xyz', password.lower()):
-            issues.append("Contains sequential characters")
-            recommendations.append("Avoid sequential characters like '123' or 'abc'")
-            score -= 10
+        score -= sum(row[2] for i, row in enumerate(self._issue_table) if flags & (1 << i))
 
-        # Calculate entropy
         charset_size = (26 if has_lower else 0) + (26 if has_upper else 0) + \
                       (10 if has_digit else 0) + (15 if has_special else 0)
         if charset_size > 0:
-            entropy = math.log2(charset_size ** len(password))
-            entropy_score = min(int(entropy / 2), 30)
-            score += entropy_score
+            entropy = pw_len * self._log2_table[charset_size]
+            score += min(int(entropy / 2), 30)
         else:
             entropy = 0
-            entropy_score = 0
+        max_entropy = pw_len * self._log2_max
 
-        # Calculate maximum possible entropy
-        max_entropy = math.log2(self.max_charset_size ** len(password))
-
-        # Normalize score
         score = max(0, min(score, 100))
+        return score, entropy, max_entropy, flags
 
-        # Determine strength
-        if score >= 90:
-            strength = "Excellent"
-            generated_password = None
-        elif score >= 70:
-            strength = "Strong"
-            generated_password = self.generate_excellent_password()
-        elif score >= 50:
-            strength = "Moderate"
-            generated_password = self.generate_excellent_password()
-        elif score >= 30:
-            strength = "Weak"
-            generated_password = self.generate_excellent_password()
-        else:
-            strength = "Very Weak"
-            generated_password = self.generate_excellent_password()
+    def _is_word_boundary(self, buf, start: int, end: int) -> bool:
+        """
+        O(1) check that a [start, end) hit is delimited by non-word
+        characters, standing in for the regex engine's \\b dispatch; works
+        on the bytes buffer and the str fallback buffer
+        """
+        if start > 0 and self._is_word_char(buf[start - 1]):
+            return False
+        if end < len(buf) and self._is_word_char(buf[end]):
+            return False
+        return True
 
-        return {
-            "score": score,
-            "strength": strength,
-            "issues": issues if issues else ["No major issues detected"],
-            "recommendations": recommendations if recommendations else ["Maintain good password practices"],
-            "entropy": round(entropy, 2),
-            "max_entropy": round(max_entropy, 2),
-            "generated_password": generated_password,
-            "has_spaces": has_spaces
-        }
+    def _is_word_char(self, c) -> bool:
+        if isinstance(c, int):  # bytes buffer element
+            return self._word_char[c] == 1
+        return c.isalnum() or c == '_'  # str fallback, Unicode semantics
+
+    def _scan(self, buf: bytes) -> Tuple[int, int, bool]:
+        """
+        Single pass over the ASCII bytes copy of the password computing the
+        character-class mask, the longest run of a repeated character, and
+        space presence
+        """
+        mask = 0
+        run = 0
+        run_max = 0
+        has_space = False
+        prev = -1
+        class_of = self._class_of
+        for b in buf:
+            mask |= class_of[b]
+            if b == prev:
+                run += 1
+            else:
+                run = 1
+                prev = b
+            if run > run_max:
+                run_max = run
+            if b == 0x20:
+                has_space = True
+        return mask, run_max, has_space
+
+    def _scan_str(self, password: str) -> Tuple[int, int, bool]:
+        """
+        str twin of _scan for non-ASCII passwords; only ASCII code points
+        index the class table, so other characters carry no class bits but
+        still count toward repeated runs
+        """
+        mask = 0
+        run = 0
+        run_max = 0
+        has_space = False
+        prev = ''
+        class_of = self._class_of
+        for c in password:
+            code = ord(c)
+            if code < 128:
+                mask |= class_of[code]
+            if c == prev:
+                run += 1
+            else:
+                run = 1
+                prev = c
+            if run > run_max:
+                run_max = run
+            if c == ' ':
+                has_space = True
+        return mask, run_max, has_space
 
     def generate_excellent_password(self, length: int = 16) -> str:
         """
         Generates a random password with an Excellent rating, no spaces
         """
-        chars = (
-            string.ascii_lowercase +
-            string.ascii_uppercase +
-            string.digits +
-            string.punctuation.replace(' ', '')
-        )
-        
-        # Ensure at least one of each required character type
-        password = [
-            random.choice(string.ascii_lowercase),
-            random.choice(string.ascii_uppercase),
-            random.choice(string.digits),
-            random.choice(string.punctuation.replace(' ', ''))
-        ]
-        
-        # Fill the rest of the password length
-        for _ in range(length - 4):
-            password.append(random.choice(chars))
-        
-        # Shuffle the password
-        random.shuffle(password)
-        return ''.join(password)
+        if length < 4:
+            raise ValueError("length must be at least 4 to cover every character type")
+
+        # Draw the whole password in one batched pull and redraw on the rare
+        # miss of a required character type; every position is independent,
+        # so no shuffle step is needed
+        while True:
+            password = self._draw_chars(_ALL_CHARS, length)
+            drawn = set(password)
+            if all(drawn & pool for pool in _POOL_SETS):
+                return ''.join(password)
+
+    @staticmethod
+    def _draw_chars(pool: str, count: int) -> List[str]:
+        """
+        Draws uniformly random characters from pool using batched os.urandom
+        bytes, rejection-sampling to avoid modulo bias
+        """
+        n = len(pool)
+        limit = 256 - (256 % n)
+        out = []
+        while len(out) < count:
+            for b in os.urandom((count - len(out)) * 2):
+                if b < limit:
+                    out.append(pool[b % n])
+                    if len(out) == count:
+                        break
+        return out
 
     def generate_recommendations(self) -> List[str]:
         """